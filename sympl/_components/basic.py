@@ -1,3 +1,4 @@
+import numpy as np
 from .._core.dataarray import DataArray
 from .._core.base_components import ImplicitTendencyComponent, TendencyComponent, DiagnosticComponent
 from .._core.units import unit_registry as ureg
@@ -359,6 +360,13 @@ class RelaxationTendencyComponent(TendencyComponent):
         return tendencies, {}
 
 
+def get_tendency_units(units):
+    if units == '':
+        return 's^-1'
+    else:
+        return units + ' s^-1'
+
+
 class TimeDifferencingWrapper(ImplicitTendencyComponent):
     """
     Wraps an Stepper object and turns it into an ImplicitTendencyComponent by applying
@@ -381,7 +389,8 @@ class TimeDifferencingWrapper(ImplicitTendencyComponent):
         return_dict = {}
         for name, properties in self._implicit.output_properties.items():
             return_dict[name] = properties.copy()
-            return_dict[name]['units'] += ' s^-1'
+            return_dict[name]['units'] = get_tendency_units(
+                properties['units'])
         return return_dict
 
     @property
@@ -408,20 +417,52 @@ class TimeDifferencingWrapper(ImplicitTendencyComponent):
         diagnostics, new_state = self._implicit(state, timestep)
         tendencies = {}
         timestep_seconds = timestep.total_seconds()
+        output_properties = self._implicit.output_properties
         for varname, data_array in new_state.items():
             if isinstance(data_array, DataArray):
-                if varname in self._implicit.output_properties.keys():
-                    if varname not in state.keys():
+                if varname in output_properties:
+                    if varname not in state:
                         raise RuntimeError(
                             'Cannot calculate tendency for {} because it is not'
                             ' present in the input state.'.format(varname))
-                    tendency = (data_array - state[varname].to_units(data_array.attrs['units'])) / timestep_seconds
-                    if data_array.attrs['units'] == '':
-                        tendency.attrs['units'] = 's^-1'
+                    old_array = state[varname]
+                    new_units = data_array.attrs['units']
+                    if old_array.attrs['units'] != new_units:
+                        old_array = old_array.to_units(new_units)
+                    output_units = output_properties[varname]['units']
+                    target_units = get_tendency_units(output_units)
+                    if new_units == output_units:
+                        units = target_units
+                    else:
+                        units = get_tendency_units(new_units)
+                    if (old_array.dims == data_array.dims and
+                            old_array.shape == data_array.shape and
+                            (len(data_array.coords) == 0 or
+                             len(old_array.coords) == 0)):
+                        # there is nothing to align, so difference the
+                        # underlying arrays directly and keep whichever
+                        # coordinates exist. Using .data rather than .values
+                        # keeps dask-backed arrays lazy.
+                        difference = data_array.data - old_array.data
+                        if (isinstance(difference, np.ndarray) and
+                                difference.dtype.kind == 'f'):
+                            # the difference is a new array, so divide it in
+                            # place rather than allocating another
+                            difference /= timestep_seconds
+                        else:
+                            difference = difference / timestep_seconds
+                        tendency = DataArray(
+                            difference,
+                            dims=data_array.dims,
+                            coords=data_array.coords or old_array.coords,
+                            attrs={'units': units})
                     else:
-                        tendency.attrs['units'] = data_array.attrs['units'] + ' s^-1'
-                    tendencies[varname] = tendency.to_units(
-                        self._implicit.output_properties[varname]['units'] + ' s^-1')
+                        tendency = (data_array - old_array) / timestep_seconds
+                        tendency.attrs['units'] = units
+                    if units != target_units:
+                        # identical unit strings need no conversion
+                        tendency = tendency.to_units(target_units)
+                    tendencies[varname] = tendency
             elif varname != 'time':
                 raise ValueError(
                     'Wrapped implicit gave an output {} of type {}, but should'
@@ -135,8 +135,8 @@ class InputChecker(object):
         super(InputChecker, self).__init__()
 
     def check_inputs(self, state):
-        for key in self.component.input_properties.keys():
-            if key not in state.keys():
+        for key in self.component.input_properties:
+            if key not in state:
                 raise InvalidStateError('Missing input quantity {}'.format(key))
 
 
@@ -497,6 +497,7 @@ class Stepper(object):
         """
         self._tendencies_in_diagnostics = tendencies_in_diagnostics
         self.name = name or self.__class__.__name__
+        self._tendency_names = {}
         super(Stepper, self).__init__()
         self._input_checker = InputChecker(self)
         self._diagnostic_checker = DiagnosticChecker(self)
@@ -558,7 +559,14 @@ class Stepper(object):
         return added_names
 
     def _get_tendency_name(self, name):
-        return '{}_tendency_from_{}'.format(name, self.name)
+        # formatted names are cached, keyed on self.name in case it is changed
+        key = (name, self.name)
+        try:
+            return self._tendency_names[key]
+        except KeyError:
+            tendency_name = '{}_tendency_from_{}'.format(name, self.name)
+            self._tendency_names[key] = tendency_name
+            return tendency_name
 
     @property
     def tendencies_in_diagnostics(self):
@@ -750,6 +758,7 @@ class TendencyComponent(object):
         """
         self._tendencies_in_diagnostics = tendencies_in_diagnostics
         self.name = name or self.__class__.__name__
+        self._tendency_names = {}
         self._input_checker = InputChecker(self)
         self._tendency_checker = TendencyChecker(self)
         self._diagnostic_checker = DiagnosticChecker(self)
@@ -789,7 +798,14 @@ class TendencyComponent(object):
         return added_names
 
     def _get_tendency_name(self, name):
-        return '{}_tendency_from_{}'.format(name, self.name)
+        # formatted names are cached, keyed on self.name in case it is changed
+        key = (name, self.name)
+        try:
+            return self._tendency_names[key]
+        except KeyError:
+            tendency_name = '{}_tendency_from_{}'.format(name, self.name)
+            self._tendency_names[key] = tendency_name
+            return tendency_name
 
     def _check_self_is_initialized(self):
         try:
@@ -861,9 +877,9 @@ class TendencyComponent(object):
         return out_tendencies, diagnostics
 
     def _insert_tendencies_to_diagnostics(self, tendencies, diagnostics):
-        for name, value in tendencies.items():
-            tendency_name = self._get_tendency_name(name)
-            diagnostics[tendency_name] = value
+        diagnostics.update(
+            (self._get_tendency_name(name), value)
+            for name, value in tendencies.items())
 
     @abc.abstractmethod
     def array_call(self, state):
@@ -974,6 +990,7 @@ class ImplicitTendencyComponent(object):
         """
         self._tendencies_in_diagnostics = tendencies_in_diagnostics
         self.name = name or self.__class__.__name__
+        self._tendency_names = {}
         self._added_diagnostic_names = []
         self._input_checker = InputChecker(self)
         self._diagnostic_checker = DiagnosticChecker(self)
@@ -1012,7 +1029,14 @@ class ImplicitTendencyComponent(object):
         return added_names
 
     def _get_tendency_name(self, name):
-        return '{}_tendency_from_{}'.format(name, self.name)
+        # formatted names are cached, keyed on self.name in case it is changed
+        key = (name, self.name)
+        try:
+            return self._tendency_names[key]
+        except KeyError:
+            tendency_name = '{}_tendency_from_{}'.format(name, self.name)
+            self._tendency_names[key] = tendency_name
+            return tendency_name
 
     def _check_self_is_initialized(self):
         try:
@@ -1087,9 +1111,9 @@ class ImplicitTendencyComponent(object):
         return out_tendencies, diagnostics
 
     def _insert_tendencies_to_diagnostics(self, tendencies, diagnostics):
-        for name, value in tendencies.items():
-            tendency_name = self._get_tendency_name(name)
-            diagnostics[tendency_name] = value
+        diagnostics.update(
+            (self._get_tendency_name(name), value)
+            for name, value in tendencies.items())
 
     @abc.abstractmethod
     def array_call(self, state, timestep):
@@ -31,23 +31,23 @@ def combine_dims(dims1, dims2):
     dims1.discard('*')
     dims2_wildcard = '*' in dims2
     dims2.discard('*')
-    unmatched_dims = set(dims1).union(dims2).difference(dims_out)
+    unmatched_dims = dims1.union(dims2)
     shared_dims = set(dims2).intersection(dims2)
     if dims1_wildcard and dims2_wildcard:
         dims_out.insert(0, '*')  # either dim can match anything
         dims_out.extend(unmatched_dims)
     elif not dims1_wildcard and not dims2_wildcard:
-        if shared_dims != set(dims1) or shared_dims != set(dims2):
+        if shared_dims != dims1 or shared_dims != dims2:
             raise InvalidPropertyDictError(
                 'dims {} and {} are incompatible'.format(dims1, dims2))
         dims_out.extend(unmatched_dims)
     elif dims1_wildcard:
-        if shared_dims != set(dims2):
+        if shared_dims != dims2:
             raise InvalidPropertyDictError(
                 'dims {} and {} are incompatible'.format(dims1, dims2))
         dims_out.extend(unmatched_dims)
     elif dims2_wildcard:
-        if shared_dims != set(dims1):
+        if shared_dims != dims1:
             raise InvalidPropertyDictError(
                 'dims {} and {} are incompatible'.format(dims1, dims2))
         dims_out.extend(unmatched_dims)
@@ -43,10 +43,12 @@ def get_numpy_array(data_array, out_dims, dim_lengths):
     dict of dim_lengths that will give the length of any missing dims in the
     data_array.
     """
-    if len(data_array.values.shape) == 0 and len(out_dims) == 0:
-        return data_array.values  # special case, 0-dimensional scalar array
+    if tuple(data_array.dims) == tuple(out_dims):
+        # already in the desired form, including 0-dimensional scalar arrays
+        return data_array.values
     else:
-        missing_dims = [dim for dim in out_dims if dim not in data_array.dims]
+        data_array_dims = set(data_array.dims)
+        missing_dims = [dim for dim in out_dims if dim not in data_array_dims]
         for dim in missing_dims:
             data_array = data_array.expand_dims(dim)
         numpy_array = data_array.transpose(*out_dims).values
@@ -40,6 +40,13 @@ def units_are_compatible(unit1, unit2):
         return False
 
 
+# cache of units_are_same results keyed on the pair of unit strings, since
+# parsing unit strings is slow and the same few pairs are compared every time
+# a component is called
+_units_are_same_cache = {}
+_units_are_same_cache_size = 512
+
+
 def units_are_same(unit1, unit2):
     """
     Compare two unit strings for equality.
@@ -54,7 +61,15 @@ def units_are_same(unit1, unit2):
     units_are_same : bool
         True if the two input unit strings represent the same unit.
     """
-    return unit_registry(unit1) == unit_registry(unit2)
+    key = (unit1, unit2)
+    try:
+        return _units_are_same_cache[key]
+    except KeyError:
+        result = unit_registry(unit1) == unit_registry(unit2)
+        if len(_units_are_same_cache) >= _units_are_same_cache_size:
+            _units_are_same_cache.clear()
+        _units_are_same_cache[key] = result
+        return result
 
 
 def clean_units(unit_string):
@@ -78,7 +93,7 @@ def data_array_to_units(value, units):
     if not hasattr(value, 'attrs') or 'units' not in value.attrs:
         raise TypeError(
             'Cannot retrieve units from type {}'.format(type(value)))
-    elif unit_registry(value.attrs['units']) != unit_registry(units):
+    elif not units_are_same(value.attrs['units'], units):
         attrs = value.attrs.copy()
         value = unit_registry.Quantity(value, value.attrs['units']).to(units).magnitude
         attrs['units'] = units
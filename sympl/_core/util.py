@@ -7,14 +7,26 @@ from .exceptions import (
     SharedKeyError, InvalidStateError)
 
 try:
-    from numba import jit
+    import numba
 except ImportError:
+    numba = None
+
+if numba is not None:
+    def jit(signature_or_function=None, **kwargs):
+        """
+        Wraps numba.jit, compiling in nopython mode unless told otherwise so
+        that functions which cannot be compiled raise an error instead of
+        silently falling back to (slow) object mode.
+        """
+        kwargs.setdefault('nopython', True)
+        return numba.jit(signature_or_function, **kwargs)
+else:
     # define a function with the same call signature as jit that does nothing
     def jit(signature_or_function=None, **kwargs):
-        if signature_or_function is None:
-            return lambda x: x
-        else:
+        if callable(signature_or_function):  # used as @jit
             return signature_or_function
+        else:  # used as @jit(...), possibly with a signature
+            return lambda func: func
 
 # internal exceptions used only within this module
 
@@ -75,38 +87,44 @@ def get_numpy_array(
     """
     # This function was written when we had directional wildcards, and could
     # be re-written to be simpler now that we do not.
-    if (len(data_array.values.shape) == 0) and (len(out_dims) == 0):
+    if '*' not in out_dims and tuple(data_array.dims) == tuple(out_dims):
+        # the array is already in the desired form, which also covers the
+        # special case of a 0-dimensional scalar array
         direction_to_names = {}  # required in case we need wildcard_matches
-        return_array = data_array.values  # special case, 0-dimensional scalar array
+        return_array = data_array.values
     else:
-        current_dim_names = {}
-        for dim in out_dims:
-            if dim != '*':
-                current_dim_names[dim] = [dim]
-        direction_to_names = get_input_array_dim_names(
-            data_array, out_dims, current_dim_names)
+        direction_to_names = get_direction_to_names(data_array, out_dims)
         if require_wildcard_matches is not None:
             for direction in out_dims:
-                if (direction in require_wildcard_matches and
-                        same_list(direction_to_names[direction],
-                                  require_wildcard_matches[direction])):
-                    direction_to_names[direction] = require_wildcard_matches[
-                        direction]
+                if direction not in require_wildcard_matches:
+                    continue
+                required = require_wildcard_matches[direction]
+                if tuple(direction_to_names[direction]) == tuple(required):
+                    # usually the matches from a previous call, already in order
+                    pass
+                elif same_list(direction_to_names[direction], required):
+                    direction_to_names[direction] = required
                 else:
                     # we could raise an exception here, because this is
                     # inconsistent, but that exception is already raised
                     # elsewhere when ensure_dims_like_are_satisfied is called
                     pass
-        target_dimension_order = get_target_dimension_order(
-            out_dims, direction_to_names)
+        target_dimension_order, slices_or_none, final_shape = (
+            get_transpose_plan(data_array, out_dims, direction_to_names))
+        target_dimension_set = set(target_dimension_order)
         for dim in data_array.dims:
-            if dim not in target_dimension_order:
+            if dim not in target_dimension_set:
                 raise DimensionNotInOutDimsError(dim)
-        slices_or_none = get_slices_and_placeholder_nones(
-            data_array, out_dims, direction_to_names)
-        final_shape = get_final_shape(data_array, out_dims, direction_to_names)
-        return_array = np.reshape(data_array.transpose(
-            *target_dimension_order).values[tuple(slices_or_none)], final_shape)
+        # transpose the numpy array directly rather than the DataArray, which
+        # only changes strides and avoids creating an intermediate DataArray
+        dim_index = {dim: i for i, dim in enumerate(data_array.dims)}
+        transposed = np.transpose(
+            data_array.values,
+            [dim_index[dim] for dim in target_dimension_order])
+        return_array = transposed[slices_or_none]
+        if return_array.shape != final_shape:
+            # only needed when several dimensions are flattened into '*'
+            return_array = np.reshape(return_array, final_shape)
     if return_wildcard_matches:
         wildcard_matches = {
             key: value for key, value in direction_to_names.items()
@@ -153,12 +171,7 @@ def restore_dimensions(array, from_dims, result_like, result_attrs=None):
     :py:function:~sympl.get_numpy_array: : Retrieves a numpy array with desired
         dimensions from a given DataArray.
     """
-    current_dim_names = {}
-    for dim in from_dims:
-        if dim != '*':
-            current_dim_names[dim] = [dim]
-    direction_to_names = get_input_array_dim_names(
-        result_like, from_dims, current_dim_names)
+    direction_to_names = get_direction_to_names(result_like, from_dims)
     original_shape = []
     original_dims = []
     original_coords = []
@@ -168,7 +181,7 @@ def restore_dimensions(array, from_dims, result_like, result_attrs=None):
                 original_shape.append(len(result_like.coords[name]))
                 original_dims.append(name)
                 original_coords.append(result_like.coords[name])
-    if np.product(array.shape) != np.product(original_shape):
+    if product(array.shape) != product(original_shape):
         raise ShapeMismatchError
     data_array = DataArray(
         np.reshape(array, original_shape),
@@ -180,16 +193,19 @@ def restore_dimensions(array, from_dims, result_like, result_attrs=None):
     return data_array
 
 
+_unix_epoch = np.datetime64('1970-01-01T00:00:00')
+_one_second = np.timedelta64(1, 's')
+
+
 def datetime64_to_datetime(dt64):
-    ts = (dt64 - np.datetime64('1970-01-01T00:00:00')) / np.timedelta64(1, 's')
+    ts = (dt64 - _unix_epoch) / _one_second
     return datetime.utcfromtimestamp(ts)
 
 
 def same_list(list1, list2):
     """Returns a boolean indicating whether the items in list1 are the same
     items present in list2 (ignoring order)."""
-    return (len(list1) == len(list2) and all(
-        [item in list2 for item in list1] + [item in list1 for item in list2]))
+    return len(list1) == len(list2) and set(list1) == set(list2)
 
 
 def update_dict_by_adding_another(dict1, dict2):
@@ -200,23 +216,25 @@ def update_dict_by_adding_another(dict1, dict2):
     array-like, to avoid data copying. Units are handled if the values are
     DataArrays with a 'units' attribute.
     """
-    for key in dict2.keys():
+    for key, value2 in dict2.items():
         if key not in dict1:
-            if hasattr(dict2[key], 'copy'):
-                dict1[key] = dict2[key].copy()
+            if hasattr(value2, 'copy'):
+                dict1[key] = value2.copy()
             else:
-                dict1[key] = dict2[key]
+                dict1[key] = value2
         else:
-            if (isinstance(dict1[key], DataArray) and isinstance(dict2[key], DataArray)):
-                if 'units' not in dict1[key].attrs or 'units' not in dict2[key].attrs:
+            value1 = dict1[key]
+            if isinstance(value1, DataArray) and isinstance(value2, DataArray):
+                if 'units' not in value1.attrs or 'units' not in value2.attrs:
                     raise InvalidStateError(
                         'DataArray objects must have units property defined')
+                value2 = value2.to_units(value1.attrs['units'])
                 try:
-                    dict1[key] += dict2[key].to_units(dict1[key].attrs['units'])
-                except ValueError:  # dict1[key] is missing a dimension present in dict2[key]
-                    dict1[key] = dict1[key] + dict2[key].to_units(dict1[key].attrs['units'])
+                    dict1[key] += value2
+                except ValueError:  # e.g. value1 is missing a dimension present in value2
+                    dict1[key] = value1 + value2
             else:
-                dict1[key] += dict2[key]  # += is in-place addition operator
+                dict1[key] += value2  # += is in-place addition operator
     return  # not returning anything emphasizes that this is in-place
 
 
@@ -231,6 +249,38 @@ def ensure_no_shared_keys(dict1, dict2):
             'unexpected shared keys: {}'.format(shared_keys))
 
 
+# cache of get_input_array_dim_names results for get_direction_to_names,
+# keyed on (data_array.dims, out_dims)
+_direction_to_names_cache = {}
+_direction_to_names_cache_size = 512
+
+
+def get_direction_to_names(data_array, out_dims):
+    """
+    Returns a mapping from the directions in out_dims to the dimension names
+    in data_array that correspond to those directions, where each direction
+    other than '*' matches only the dimension of the same name.
+
+    Results depend only on data_array.dims and out_dims, and are cached on
+    those so that repeated calls with the same dimensions (for example, once
+    per time step) do not need to recompute them.
+    """
+    key = (tuple(data_array.dims), tuple(out_dims))
+    try:
+        cached = _direction_to_names_cache[key]
+    except KeyError:
+        dim_names = {}
+        for dim in out_dims:
+            if dim != '*':
+                dim_names[dim] = [dim]
+        cached = get_input_array_dim_names(data_array, out_dims, dim_names)
+        if len(_direction_to_names_cache) >= _direction_to_names_cache_size:
+            _direction_to_names_cache.clear()
+        _direction_to_names_cache[key] = cached
+    # copy so that callers can modify the result without affecting the cache
+    return {direction: list(names) for direction, names in cached.items()}
+
+
 def get_input_array_dim_names(data_array, out_dims, dim_names):
     """
     Parameters
@@ -250,82 +300,84 @@ def get_input_array_dim_names(data_array, out_dims, dim_names):
         present in data_array that correspond to those directions
     """
     input_array_dim_names = {}
+    dim_to_direction = {}
     for direction in out_dims:
+        input_array_dim_names[direction] = []
         if direction != '*':
-            matching_dims = set(
-                data_array.dims).intersection(dim_names[direction])
-            # must ensure matching dims are in right order
-            input_array_dim_names[direction] = []
-            for dim in data_array.dims:
-                if dim in matching_dims:
-                    input_array_dim_names[direction].append(dim)
-            if (direction not in ('x', 'y', 'z', '*') and
-                    len(input_array_dim_names[direction]) == 0):
-                raise NoMatchForDirectionError(direction)
-    if '*' in out_dims:
-        matching_dims = set(
-            data_array.dims).difference(set.union(set([]), *input_array_dim_names.values()))
-        input_array_dim_names['*'] = []
-        for dim in data_array.dims:
-            if dim in matching_dims:
-                input_array_dim_names['*'].append(dim)
-    return input_array_dim_names
-
-
-def get_target_dimension_order(out_dims, direction_to_names):
-    """
-    Takes in an iterable of directions ('x', 'y', 'z', or '*') and a dictionary
-    mapping those directions to a list of names corresponding to those
-    directions. Returns a list of names in the same order as in out_dims,
-    preserving the order within direction_to_names for each direction.
-    """
-    target_dimension_order = []
+            for dim in dim_names[direction]:
+                dim_to_direction.setdefault(dim, direction)
+    wildcard_names = input_array_dim_names.get('*')
+    # iterate over data_array.dims so matching dims are in right order
+    for dim in data_array.dims:
+        direction = dim_to_direction.get(dim)
+        if direction is not None:
+            input_array_dim_names[direction].append(dim)
+        elif wildcard_names is not None:
+            wildcard_names.append(dim)
     for direction in out_dims:
-        target_dimension_order.extend(direction_to_names[direction])
-    return target_dimension_order
+        if (direction not in ('x', 'y', 'z', '*') and
+                len(input_array_dim_names[direction]) == 0):
+            raise NoMatchForDirectionError(direction)
+    return input_array_dim_names
 
 
-def get_slices_and_placeholder_nones(data_array, out_dims, direction_to_names):
+def get_transpose_plan(data_array, out_dims, direction_to_names):
     """
     Takes in a DataArray, a desired ordering of output directions, and
     a dictionary mapping those directions to a list of names corresponding to
-    those directions. Returns a list with the same ordering as out_dims that
-    contains slices for out_dims that have corresponding names (as many slices
-    as names, and spanning the entire dimension named), and None for out_dims
-    without corresponding names.
-
-    This returned list can be used to create length-1 axes for the dimensions
-    that currently have no corresponding names in data_array.
+    those directions. Returns, in a single pass over out_dims:
+
+    * a list of names in the same order as in out_dims, preserving the order
+      within direction_to_names for each direction, which data_array must be
+      transposed to;
+    * a tuple with the same ordering as out_dims that contains slices for
+      out_dims that have corresponding names (as many slices as names, and
+      spanning the entire dimension named), and None for out_dims without
+      corresponding names, which can be used to create length-1 axes for
+      those dimensions;
+    * the final shape that the transposed array must be reshaped to in order
+      to have one axis for each of the out_dims (for instance, combining all
+      axes collected by the '*' direction).
     """
+    dim_lengths = dict(zip(data_array.dims, data_array.shape))
+    target_dimension_order = []
     slices_or_none = []
+    final_shape = []
     for direction in out_dims:
-        if len(direction_to_names[direction]) == 0:
+        names = direction_to_names[direction]
+        if len(names) == 0:
             slices_or_none.append(None)
-        elif (direction != '*') and (len(direction_to_names[direction]) > 1):
+            final_shape.append(1)
+        elif (direction != '*') and (len(names) > 1):
             raise ValueError(
                 'DataArray has multiple dimensions for a single direction')
         else:
-            for name in direction_to_names[direction]:
-                slices_or_none.append(slice(0, len(data_array.coords[name])))
-    return tuple(slices_or_none)
+            # determine shape once dimensions for direction (usually '*') are combined
+            length = 1
+            for name in names:
+                target_dimension_order.append(name)
+                slices_or_none.append(slice(0, dim_lengths[name]))
+                length *= dim_lengths[name]
+            final_shape.append(length)
+    return target_dimension_order, tuple(slices_or_none), tuple(final_shape)
 
 
-def get_final_shape(data_array, out_dims, direction_to_names):
+def product(values):
     """
-    Determine the final shape that data_array must be reshaped to in order to
-    have one axis for each of the out_dims (for instance, combining all
-    axes collected by the '*' direction).
+    Returns the product of an iterable of integers as a Python integer. This
+    is much faster than np.prod for the short sequences of array lengths it
+    is used on.
     """
-    final_shape = []
-    for direction in out_dims:
-        if len(direction_to_names[direction]) == 0:
-            final_shape.append(1)
-        else:
-            # determine shape once dimensions for direction (usually '*') are combined
-            final_shape.append(
-                np.product([len(data_array.coords[name])
-                            for name in direction_to_names[direction]]))
-    return tuple(final_shape)
+    result = 1
+    for value in values:
+        result *= value
+    return result
+
+
+# property types in ascending order of priority for get_component_aliases
+_alias_property_types = (
+    'tendency_properties', 'diagnostic_properties', 'output_properties',
+    'input_properties')
 
 
 def get_component_aliases(*args):
@@ -350,13 +402,11 @@ def get_component_aliases(*args):
         A dictionary mapping quantity names to aliases
     """
     return_dict = {}
-    for property_type in (
-            'tendency_properties', 'diagnostic_properties', 'output_properties',
-            'input_properties'):
+    for property_type in _alias_property_types:
         for component in args:
-            if hasattr(component, property_type):
-                component_properties = getattr(component, property_type)
+            component_properties = getattr(component, property_type, None)
+            if component_properties is not None:
                 for name, properties in component_properties.items():
-                    if 'alias' in properties.keys():
+                    if 'alias' in properties:
                         return_dict[name] = properties['alias']
     return return_dict
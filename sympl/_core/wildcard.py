@@ -1,29 +1,39 @@
 import numpy as np
 from .exceptions import InvalidStateError, InvalidPropertyDictError
+from .util import product
 
 
 def get_wildcard_matches_and_dim_lengths(state, property_dictionary):
     wildcard_names = []
+    wildcard_name_set = set()
+    has_wildcard = False
     dim_lengths = {}
     # Loop to get the set of names matching "*" (wildcard names)
     for quantity_name, properties in property_dictionary.items():
         ensure_properties_have_dims_and_units(properties, quantity_name)
-        for dim_name, length in zip(state[quantity_name].dims, state[quantity_name].shape):
-            if dim_name not in dim_lengths.keys():
+        quantity = state[quantity_name]
+        property_dims = properties['dims']
+        new_wildcard_names = []
+        for dim_name, length in zip(quantity.dims, quantity.shape):
+            if dim_name not in dim_lengths:
                 dim_lengths[dim_name] = length
             elif length != dim_lengths[dim_name]:
                 raise InvalidStateError(
                     'Dimension {} conflicting lengths {} and {} in different '
                     'state quantities.'.format(dim_name, length, dim_lengths[dim_name]))
-        new_wildcard_names = [
-            dim for dim in state[quantity_name].dims if dim not in properties['dims']]
-        if len(new_wildcard_names) > 0 and '*' not in properties['dims']:
+            if dim_name not in property_dims:
+                new_wildcard_names.append(dim_name)
+        quantity_has_wildcard = '*' in property_dims
+        has_wildcard = has_wildcard or quantity_has_wildcard
+        if len(new_wildcard_names) > 0 and not quantity_has_wildcard:
             raise InvalidStateError(
                 'Quantity {} has unexpected dimensions {}.'.format(
                     quantity_name, new_wildcard_names))
-        wildcard_names.extend(
-            [name for name in new_wildcard_names if name not in wildcard_names])
-    if not any('dims' in p.keys() and '*' in p['dims'] for p in property_dictionary.values()):
+        for name in new_wildcard_names:
+            if name not in wildcard_name_set:
+                wildcard_name_set.add(name)
+                wildcard_names.append(name)
+    if not has_wildcard:
         wildcard_names = None  # can't determine wildcard matches if there is no wildcard
     else:
         wildcard_names = tuple(wildcard_names)
@@ -31,44 +41,34 @@ def get_wildcard_matches_and_dim_lengths(state, property_dictionary):
 
 
 def flatten_wildcard_dims(array, i_start, i_end):
-    if i_end > len(array.shape):
-        raise ValueError('i_end should be less than the number of axes in array')
-    elif i_start < 0:
-        raise ValueError('i_start should be greater than 0')
-    elif i_start > i_end:
-        raise ValueError('i_start should be less than or equal to i_end')
-    elif i_start == i_end:
-        # We need to insert a singleton dimension at i_start
-        target_shape = []
-        target_shape.extend(array.shape)
-        target_shape.insert(i_start, 1)
-    else:
-        target_shape = []
-        wildcard_length = 1
-        for i, length in enumerate(array.shape):
-            if i_start <= i < i_end:
-                wildcard_length *= length
-            else:
-                target_shape.append(length)
-            if i == i_end - 1:
-                target_shape.append(wildcard_length)
+    shape = tuple(array.shape)
+    if not 0 <= i_start <= i_end <= len(shape):
+        if i_end > len(shape):
+            raise ValueError('i_end should be less than the number of axes in array')
+        elif i_start < 0:
+            raise ValueError('i_start should be greater than 0')
+        else:
+            raise ValueError('i_start should be less than or equal to i_end')
+    # when i_start == i_end the product is 1, inserting a singleton dimension
+    wildcard_length = product(shape[i_start:i_end])
+    target_shape = shape[:i_start] + (wildcard_length,) + shape[i_end:]
     return array.reshape(target_shape)
 
 
 def fill_dims_wildcard(
         out_dims, dim_lengths, wildcard_names, expand_wildcard=True):
     i_wildcard = out_dims.index('*')
-    target_shape = []
-    out_dims_without_wildcard = []
-    for i, out_dim in enumerate(out_dims):
-        if i == i_wildcard and expand_wildcard:
-            target_shape.extend([dim_lengths[n] for n in wildcard_names])
-            out_dims_without_wildcard.extend(wildcard_names)
-        elif i == i_wildcard and not expand_wildcard:
-            target_shape.append(np.product([dim_lengths[n] for n in wildcard_names]))
-        else:
-            target_shape.append(dim_lengths[out_dim])
-            out_dims_without_wildcard.append(out_dim)
+    dims_before = list(out_dims[:i_wildcard])
+    dims_after = list(out_dims[i_wildcard+1:])
+    wildcard_shape = [dim_lengths[n] for n in wildcard_names]
+    if expand_wildcard:
+        out_dims_without_wildcard = dims_before + list(wildcard_names) + dims_after
+    else:
+        out_dims_without_wildcard = dims_before + dims_after
+        wildcard_shape = [product(wildcard_shape)]
+    target_shape = (
+        [dim_lengths[n] for n in dims_before] + wildcard_shape +
+        [dim_lengths[n] for n in dims_after])
     return out_dims_without_wildcard, target_shape
 
 
@@ -3,6 +3,63 @@ from .._core.base_components import (
 )
 
 
+def forwarded_property(component_attribute, name):
+    """
+    Returns a property which reads the attribute called name from the wrapped
+    component stored in component_attribute. Defining these on wrapper
+    classes lets frequently used attributes skip the __getattr__ fallback,
+    which is only reached after normal lookup has raised AttributeError. If
+    the component does not have the attribute, AttributeError is still
+    raised, so hasattr behaves the same as before.
+    """
+    def fget(self):
+        return getattr(getattr(self, component_attribute), name)
+    return property(fget)
+
+
+def to_float_items(scale_factors):
+    """
+    Returns the (name, scale factor) pairs in scale_factors as a tuple, with
+    the scale factors converted to float, so they can be iterated directly
+    on each call.
+    """
+    return tuple(
+        (name, float(value)) for name, value in scale_factors.items())
+
+
+def scale_values(values, scale_factors):
+    """
+    Takes a dictionary of arrays and a sequence of (name, scale factor)
+    pairs, and replaces the named arrays with scaled copies. The arrays are
+    not scaled in place, since the caller or a component may still hold a
+    reference to them, and so that dask-backed arrays stay lazy.
+    """
+    for name, scale_factor in scale_factors:
+        value = values[name]
+        scaled_value = value*scale_factor
+        # binary operations drop attrs in older xarray releases
+        scaled_value.attrs = value.attrs
+        values[name] = scaled_value
+
+
+def scale_tendencies(tendencies, diagnostics, scale_factors):
+    """
+    Scales tendencies as in scale_values. Any diagnostic which is the same
+    object as a scaled tendency, as when a component has
+    tendencies_in_diagnostics=True, is replaced by the scaled tendency so
+    the two stay consistent.
+    """
+    # the unscaled arrays are kept in the values, so their ids stay unique
+    unscaled = dict(
+        (id(tendencies[name]), (name, tendencies[name]))
+        for name, _ in scale_factors)
+    scale_values(tendencies, scale_factors)
+    for name, value in list(diagnostics.items()):
+        entry = unscaled.get(id(value))
+        if entry is not None and entry[1] is value:
+            diagnostics[name] = tendencies[entry[0]]
+
+
 class ScalingWrapper(object):
     """
     Wraps any component and scales either inputs, outputs or tendencies
@@ -19,6 +76,12 @@ class ScalingWrapper(object):
     >>>         'air_temperature' = 1.5})
     """
 
+    input_properties = forwarded_property('_component', 'input_properties')
+    output_properties = forwarded_property('_component', 'output_properties')
+    tendency_properties = forwarded_property('_component', 'tendency_properties')
+    diagnostic_properties = forwarded_property(
+        '_component', 'diagnostic_properties')
+
     def __init__(self,
                  component,
                  input_scale_factors=None,
@@ -58,26 +121,35 @@ class ScalingWrapper(object):
             The keys in the scale factors do not correspond to valid
             input/output/tendency for this component.
         """
-        if not any(
-                isinstance(component, t) for t in [
-                    DiagnosticComponent, TendencyComponent, ImplicitTendencyComponent, Stepper]):
+        # the component type cannot change, so choose how to call it once here
+        # instead of checking its type on every call
+        if isinstance(component, Stepper):
+            self._call_component = self._call_stepper
+        elif isinstance(component, TendencyComponent):
+            self._call_component = self._call_tendency_component
+        elif isinstance(component, ImplicitTendencyComponent):
+            self._call_component = self._call_implicit_tendency_component
+        elif isinstance(component, DiagnosticComponent):
+            self._call_component = self._call_diagnostic_component
+        else:
             raise TypeError(
                 'component must be a component type (DiagnosticComponent, TendencyComponent, '
                 'ImplicitTendencyComponent, or Stepper)'
             )
 
         self._component = component
-        self._input_scale_factors = dict()
+        self._input_scale_factors = ()
         if input_scale_factors is not None:
 
-            for input_field in input_scale_factors.keys():
-                if input_field not in component.input_properties.keys():
+            input_properties = component.input_properties
+            for input_field in input_scale_factors:
+                if input_field not in input_properties:
                     raise ValueError(
                         "{} is not a valid input quantity.".format(input_field))
 
-            self._input_scale_factors = input_scale_factors
+            self._input_scale_factors = to_float_items(input_scale_factors)
 
-        self._diagnostic_scale_factors = dict()
+        self._diagnostic_scale_factors = ()
         if diagnostic_scale_factors is not None:
             if not hasattr(component, 'diagnostic_properties'):
                 raise TypeError(
@@ -85,9 +157,9 @@ class ScalingWrapper(object):
                     'diagnostic output.')
             self._ensure_fields_have_properties(
                 diagnostic_scale_factors, component.diagnostic_properties, 'diagnostic')
-            self._diagnostic_scale_factors = diagnostic_scale_factors
+            self._diagnostic_scale_factors = to_float_items(diagnostic_scale_factors)
 
-        self._output_scale_factors = dict()
+        self._output_scale_factors = ()
         if output_scale_factors is not None:
             if not hasattr(component, 'output_properties'):
                 raise TypeError(
@@ -95,9 +167,9 @@ class ScalingWrapper(object):
                     'output_properties.')
             self._ensure_fields_have_properties(
                 output_scale_factors, component.output_properties, 'output')
-            self._output_scale_factors = output_scale_factors
+            self._output_scale_factors = to_float_items(output_scale_factors)
 
-        self._tendency_scale_factors = dict()
+        self._tendency_scale_factors = ()
         if tendency_scale_factors is not None:
             if not hasattr(component, 'tendency_properties'):
                 raise TypeError(
@@ -105,12 +177,12 @@ class ScalingWrapper(object):
                     'not output tendencies.')
             self._ensure_fields_have_properties(
                 tendency_scale_factors, component.tendency_properties, 'tendency')
-            self._tendency_scale_factors = tendency_scale_factors
+            self._tendency_scale_factors = to_float_items(tendency_scale_factors)
 
     def _ensure_fields_have_properties(
             self, scale_factors, properties, properties_name):
-        for field in scale_factors.keys():
-            if field not in properties.keys():
+        for field in scale_factors:
+            if field not in properties:
                 raise ValueError(
                     "{} is not a {} quantity in the given component"
                     ", but was given a scale factor.".format(field, properties_name))
@@ -135,58 +207,48 @@ class ScalingWrapper(object):
         *args
             The return values of the underlying component.
         """
-        scaled_state = {}
-        if 'time' in state:
-            scaled_state['time'] = state['time']
-
-        for input_field in self.input_properties.keys():
-            if input_field in self._input_scale_factors:
-                scale_factor = self._input_scale_factors[input_field]
-                scaled_state[input_field] = state[input_field]*float(scale_factor)
-                scaled_state[input_field].attrs = state[input_field].attrs
-            else:
-                scaled_state[input_field] = state[input_field]
-
-        if isinstance(self._component, Stepper):
-            if timestep is None:
-                raise TypeError('Must give timestep to call Stepper.')
-            diagnostics, new_state = self._component(scaled_state, timestep)
-            for name in self._output_scale_factors.keys():
-                scale_factor = self._output_scale_factors[name]
-                new_state[name] *= float(scale_factor)
-            for name in self._diagnostic_scale_factors.keys():
-                scale_factor = self._diagnostic_scale_factors[name]
-                diagnostics[name] *= float(scale_factor)
-            return diagnostics, new_state
-        elif isinstance(self._component, TendencyComponent):
-            tendencies, diagnostics = self._component(scaled_state)
-            for tend_field in self._tendency_scale_factors.keys():
-                scale_factor = self._tendency_scale_factors[tend_field]
-                tendencies[tend_field] *= float(scale_factor)
-            for name in self._diagnostic_scale_factors.keys():
-                scale_factor = self._diagnostic_scale_factors[name]
-                diagnostics[name] *= float(scale_factor)
-            return tendencies, diagnostics
-        elif isinstance(self._component, ImplicitTendencyComponent):
-            if timestep is None:
-                raise TypeError('Must give timestep to call ImplicitTendencyComponent.')
-            tendencies, diagnostics = self._component(scaled_state, timestep)
-            for tend_field in self._tendency_scale_factors.keys():
-                scale_factor = self._tendency_scale_factors[tend_field]
-                tendencies[tend_field] *= float(scale_factor)
-            for name in self._diagnostic_scale_factors.keys():
-                scale_factor = self._diagnostic_scale_factors[name]
-                diagnostics[name] *= float(scale_factor)
-            return tendencies, diagnostics
-        elif isinstance(self._component, DiagnosticComponent):
-            diagnostics = self._component(scaled_state)
-            for name in self._diagnostic_scale_factors.keys():
-                scale_factor = self._diagnostic_scale_factors[name]
-                diagnostics[name] *= float(scale_factor)
-            return diagnostics
-        else:  # Should never reach this
-            raise RuntimeError(
-                'Unknown component type, seems to be a bug in ScalingWrapper')
+        if not self._input_scale_factors:
+            # nothing to scale, the component only reads its own inputs
+            scaled_state = state
+        else:
+            scaled_state = {
+                name: state[name]
+                for name in self._component.input_properties.keys()}
+            if 'time' in state:
+                scaled_state['time'] = state['time']
+            # only the (usually few) scaled inputs need new arrays
+            scale_values(scaled_state, self._input_scale_factors)
+
+        return self._call_component(scaled_state, timestep)
+
+    def _call_stepper(self, state, timestep):
+        if timestep is None:
+            raise TypeError('Must give timestep to call Stepper.')
+        diagnostics, new_state = self._component(state, timestep)
+        scale_values(new_state, self._output_scale_factors)
+        scale_values(diagnostics, self._diagnostic_scale_factors)
+        return diagnostics, new_state
+
+    def _call_tendency_component(self, state, timestep):
+        tendencies, diagnostics = self._component(state)
+        scale_tendencies(
+            tendencies, diagnostics, self._tendency_scale_factors)
+        scale_values(diagnostics, self._diagnostic_scale_factors)
+        return tendencies, diagnostics
+
+    def _call_implicit_tendency_component(self, state, timestep):
+        if timestep is None:
+            raise TypeError('Must give timestep to call ImplicitTendencyComponent.')
+        tendencies, diagnostics = self._component(state, timestep)
+        scale_tendencies(
+            tendencies, diagnostics, self._tendency_scale_factors)
+        scale_values(diagnostics, self._diagnostic_scale_factors)
+        return tendencies, diagnostics
+
+    def _call_diagnostic_component(self, state, timestep):
+        diagnostics = self._component(state)
+        scale_values(diagnostics, self._diagnostic_scale_factors)
+        return diagnostics
 
 
 class UpdateFrequencyWrapper(object):
@@ -203,7 +265,14 @@ class UpdateFrequencyWrapper(object):
     >>> prognostic = UpdateFrequencyWrapper(MyPrognostic(), timedelta(hours=1))
     """
 
-    def __init__(self, component, update_timedelta):
+    input_properties = forwarded_property('component', 'input_properties')
+    output_properties = forwarded_property('component', 'output_properties')
+    tendency_properties = forwarded_property('component', 'tendency_properties')
+    diagnostic_properties = forwarded_property(
+        'component', 'diagnostic_properties')
+
+    def __init__(self, component, update_timedelta=None,
+                 update_every_n_calls=None):
         """
         Initialize the UpdateFrequencyWrapper object.
 
@@ -211,14 +280,43 @@ class UpdateFrequencyWrapper(object):
         ----
         component : TendencyComponent, Stepper, DiagnosticComponent, ImplicitTendencyComponent
             The component to be wrapped.
-        update_timedelta : timedelta
+        update_timedelta : timedelta, optional
             The amount that state['time'] must differ from when output
             was cached before new output is computed.
+        update_every_n_calls : int, optional
+            If given instead of update_timedelta, new output is computed
+            on the first call and then on every n-th call, regardless of
+            state['time']. Note that this counts calls, not model time
+            steps: a TimeStepper with several stages, such as
+            SSPRungeKutta, calls its components once per stage.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one of update_timedelta and update_every_n_calls
+            is given, or if update_every_n_calls is less than 1.
         """
+        if (update_timedelta is None) == (update_every_n_calls is None):
+            raise ValueError(
+                'Exactly one of update_timedelta and update_every_n_calls '
+                'must be given.')
+        if update_every_n_calls is not None and update_every_n_calls < 1:
+            raise ValueError(
+                'update_every_n_calls must be at least 1, but {} was '
+                'given.'.format(update_every_n_calls))
         self.component = component
+        # decide once whether to pass on the timestep, rather than catching
+        # a TypeError from the call, which could come from inside the component
+        self._uses_timestep = isinstance(
+            component, (Stepper, ImplicitTendencyComponent))
         self._update_timedelta = update_timedelta
+        self._update_every_n_calls = update_every_n_calls
         self._cached_output = None
         self._last_update_time = None
+        self._next_update_time = None
+        self._call_counter = 0
+        if update_every_n_calls is not None:
+            self._last_update_call = -update_every_n_calls
 
     def __call__(self, state, timestep=None, **kwargs):
         """
@@ -239,17 +337,25 @@ class UpdateFrequencyWrapper(object):
         *args
             The return values of the underlying component.
         """
-        if ((self._last_update_time is None) or
-                (state['time'] >= self._last_update_time +
-                 self._update_timedelta)):
-            if timestep is not None:
-                try:
-                    self._cached_output = self.component(state, timestep, **kwargs)
-                except TypeError:
-                    self._cached_output = self.component(state, **kwargs)
+        if self._update_every_n_calls is not None:
+            self._call_counter += 1
+            needs_update = (
+                self._call_counter - self._last_update_call >=
+                self._update_every_n_calls)
+        else:
+            needs_update = ((self._next_update_time is None) or
+                            (state['time'] >= self._next_update_time))
+        if needs_update:
+            if timestep is not None and self._uses_timestep:
+                self._cached_output = self.component(state, timestep, **kwargs)
             else:
                 self._cached_output = self.component(state, **kwargs)
-            self._last_update_time = state['time']
+            if self._update_every_n_calls is not None:
+                self._last_update_call = self._call_counter
+            else:
+                self._last_update_time = state['time']
+                self._next_update_time = (
+                    state['time'] + self._update_timedelta)
         return self._cached_output
 
     def __getattr__(self, item):
@@ -1,5 +1,4 @@
 import pytest
-import mock
 import numpy as np
 import unittest
 from sympl import (
@@ -10,8 +9,7 @@ from sympl import (
 )
 
 def same_list(list1, list2):
-    return (len(list1) == len(list2) and all(
-        [item in list2 for item in list1] + [item in list1 for item in list2]))
+    return len(list1) == len(list2) and set(list1) == set(list2)
 
 
 class MockTendencyComponent(TendencyComponent):
@@ -1286,6 +1284,31 @@ class PrognosticTests(unittest.TestCase, InputTestBase):
         assert diagnostics[tendency_name].attrs['units'] == 'm/s'
         assert np.all(diagnostics[tendency_name].values == 20.)
 
+    def test_tendencies_in_diagnostics_repeated_calls(self):
+        input_properties = {}
+        diagnostic_properties = {}
+        tendency_properties = {
+            'output1': {
+                'dims': ['dim1'],
+                'units': 'm/s'
+            }
+        }
+        diagnostic_output = {}
+        tendency_output = {
+            'output1': np.ones([10]) * 20.,
+        }
+        prognostic = self.component_class(
+            input_properties, diagnostic_properties, tendency_properties,
+            diagnostic_output, tendency_output, tendencies_in_diagnostics=True,
+            name='component',
+        )
+        state = {
+            'time': timedelta(0),
+        }
+        for i in range(2):
+            _, diagnostics = self.call_component(prognostic, state)
+            assert list(diagnostics.keys()) == ['output1_tendency_from_component']
+
 
 class ImplicitPrognosticTests(PrognosticTests):
 
@@ -2065,6 +2088,36 @@ class ImplicitTests(unittest.TestCase, InputTestBase, DiagnosticTestBase):
         assert diagnostics['output1_tendency_from_component'].attrs['units'] == 'm s^-1'
         assert np.all(diagnostics['output1_tendency_from_component'].values == 1.)
 
+    def test_tendencies_in_diagnostics_repeated_calls(self):
+        input_properties = {}
+        diagnostic_properties = {}
+        output_properties = {
+            'output1': {
+                'dims': ['dim1'],
+                'units': 'm'
+            }
+        }
+        diagnostic_output = {}
+        output_state = {
+            'output1': np.ones([10]) * 7.,
+        }
+        implicit = MockStepper(
+            input_properties, diagnostic_properties, output_properties,
+            diagnostic_output, output_state, tendencies_in_diagnostics=True,
+            name='component'
+        )
+        state = {
+            'time': timedelta(0),
+            'output1': DataArray(
+                np.ones([10]) * 2.,
+                dims=['dim1'],
+                attrs={'units': 'm'}
+            ),
+        }
+        for i in range(2):
+            diagnostics, _ = implicit(state, timedelta(seconds=5))
+            assert list(diagnostics.keys()) == ['output1_tendency_from_component']
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -9,8 +9,7 @@ from sympl._core.units import units_are_compatible
 
 
 def same_list(list1, list2):
-    return (len(list1) == len(list2) and all(
-        [item in list2 for item in list1] + [item in list1 for item in list2]))
+    return len(list1) == len(list2) and set(list1) == set(list2)
 
 
 class MockTendencyComponent(TendencyComponent):
@@ -249,6 +249,22 @@ def test_get_numpy_array_zyx_to_starz_doesnt_copy():
     assert arrays_share_same_memory_space(array.values, numpy_array)
 
 
+def test_get_numpy_array_wildcard_matches_unchanged_on_repeated_call():
+    array = DataArray(
+        np.random.randn(2, 3, 4),
+        dims=['z', 'y', 'x'],
+        attrs={'units': ''}
+    )
+    numpy_array, wildcard_matches = get_numpy_array(
+        array, ['*', 'z'], return_wildcard_matches=True)
+    assert wildcard_matches == {'*': ['y', 'x']}
+    wildcard_matches['*'].append('q')
+    numpy_array, wildcard_matches = get_numpy_array(
+        array, ['*', 'z'], return_wildcard_matches=True)
+    assert wildcard_matches == {'*': ['y', 'x']}
+    assert numpy_array.shape == (12, 2)
+
+
 def test_restore_dimensions_complicated_asterisk():
     array = DataArray(
         np.random.randn(2, 3, 4, 5),
@@ -4,6 +4,7 @@ from sympl import (
     TendencyComponent, Stepper, DiagnosticComponent, TimeDifferencingWrapper, DataArray
 )
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from copy import deepcopy
 
@@ -49,6 +50,28 @@ class MockStepper(Stepper):
         )
 
 
+class MockStepper2D(Stepper):
+
+    input_properties = {
+        'value': {
+            'dims': ['x', 'y'],
+            'units': 'm'
+        }
+    }
+
+    output_properties = {
+        'value': {
+            'dims': ['x', 'y'],
+            'units': 'm'
+        }
+    }
+
+    diagnostic_properties = {}
+
+    def array_call(self, state, timestep):
+        return {}, {'value': state['value'] + 2.}
+
+
 class MockStepperThatExpects(Stepper):
 
     input_properties = {'expected_field': {}}
@@ -125,6 +148,25 @@ class TimeDifferencingTests(unittest.TestCase):
         assert diagnostics['num_updates'].values == 2
         assert len(diagnostics.keys()) == 1
 
+    def testWrapperTendencyProperties(self):
+        assert self.wrapped.tendency_properties == {
+            'value': {'dims': [], 'units': 'm s^-1'}}
+        assert self.wrapped.tendency_properties == {
+            'value': {'dims': [], 'units': 'm s^-1'}}
+        assert self.implicit.output_properties['value']['units'] == 'm'
+
+    def testWrapperTendencyPropertiesFollowOutputProperties(self):
+        self.implicit.output_properties = {
+            'value': {'dims': [], 'units': 'm'},
+            'other': {'dims': [], 'units': 'km'},
+        }
+        assert self.wrapped.tendency_properties == {
+            'value': {'dims': [], 'units': 'm s^-1'},
+            'other': {'dims': [], 'units': 'km s^-1'},
+        }
+        self.wrapped.tendency_properties['value']['units'] = 'changed'
+        assert self.wrapped.tendency_properties['value']['units'] == 'm s^-1'
+
     def testWrapperComputesTendency(self):
         tendencies, diagnostics = self.wrapped(self.state, timedelta(seconds=1))
         assert len(tendencies.keys()) == 1
@@ -145,6 +187,59 @@ class TimeDifferencingTests(unittest.TestCase):
         assert_allclose(tendencies['value'].values[0], -2.)
         assert_allclose(tendencies['value'].to_units('km s^-1').values[0], -0.002)
 
+    def testWrapperDividesByTimestep(self):
+        state = {
+            'time': timedelta(0),
+            'value': DataArray([0.7], attrs={'units': 'm'})
+        }
+        tendencies, diagnostics = self.wrapped(state, timedelta(seconds=3))
+        # exact comparison, results should match true division bit for bit
+        assert tendencies['value'].values[0] == (1. - 0.7) / 3.
+
+
+class MockDimensionlessStepper(Stepper):
+
+    input_properties = {}
+
+    output_properties = {
+        'value': {
+            'dims': [],
+            'units': ''
+        }
+    }
+
+    diagnostic_properties = {}
+
+    def array_call(self, state, timestep):
+        return {}, {'value': 1}
+
+
+def test_time_differencing_wrapper_dimensionless_tendency_units():
+    wrapped = TimeDifferencingWrapper(MockDimensionlessStepper())
+    assert wrapped.tendency_properties['value']['units'] == 's^-1'
+    state = {
+        'time': timedelta(0),
+        'value': DataArray([0.], attrs={'units': ''}),
+    }
+    tendencies, diagnostics = wrapped(state, timedelta(seconds=2))
+    assert tendencies['value'].attrs['units'] == 's^-1'
+    assert_allclose(tendencies['value'].values, 0.5)
+
+
+def test_time_differencing_wrapper_2d_keeps_coords():
+    wrapped = TimeDifferencingWrapper(MockStepper2D())
+    state = {
+        'time': timedelta(0),
+        'value': DataArray(
+            np.zeros((2, 3)), dims=['x', 'y'],
+            coords={'x': [10., 20.]}, attrs={'units': 'm'}),
+    }
+    tendencies, diagnostics = wrapped(state, timedelta(seconds=4))
+    assert tendencies['value'].dims == ('x', 'y')
+    assert tendencies['value'].attrs['units'] == 'm s^-1'
+    assert_allclose(tendencies['value'].values, 0.5)
+    assert_allclose(tendencies['value'].coords['x'].values, [10., 20.])
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -19,6 +19,13 @@ def test_units_are_same_meters():
     assert units_are_same('kilometers', 'km')
 
 
+def test_units_are_same_repeated():
+    for i in range(2):
+        assert units_are_same('m', 'meter')
+        assert not units_are_same('m', 'km')
+        assert not units_are_same('km', 'm')
+
+
 def test_is_valid_unit_invalid_values():
     assert not is_valid_unit('george')
     assert not is_valid_unit('boop')
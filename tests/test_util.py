@@ -4,15 +4,15 @@ import pytest
 from sympl import (
     TendencyComponent, ensure_no_shared_keys, SharedKeyError, DataArray,
     Stepper, DiagnosticComponent,
-    InvalidPropertyDictError)
+    InvalidPropertyDictError, jit)
 from sympl._core.util import update_dict_by_adding_another, \
     get_component_aliases
 from sympl._core.combine_properties import combine_dims
+from sympl._core.wildcard import flatten_wildcard_dims, fill_dims_wildcard
 
 
 def same_list(list1, list2):
-    return (len(list1) == len(list2) and all(
-        [item in list2 for item in list1] + [item in list1 for item in list2]))
+    return len(list1) == len(list2) and set(list1) == set(list2)
 
 
 class PrognosticPropertiesContainer(object):
@@ -126,6 +126,65 @@ def test_update_dict_by_adding_another_adds_shared_arrays_reversed():
     assert len(dict2.keys()) == 2
 
 
+def test_update_dict_by_adding_another_adds_data_arrays_in_place():
+    old_values = np.ones([2, 3])
+    old_array = DataArray(
+        old_values, dims=['dim1', 'dim2'], attrs={'units': 'm'})
+    dict1 = {'quantity': old_array}
+    dict2 = {
+        'quantity': DataArray(
+            np.ones([3]) * 1000., dims=['dim2'], attrs={'units': 'mm'})
+    }
+    update_dict_by_adding_another(dict1, dict2)
+    assert dict1['quantity'] is old_array
+    assert dict1['quantity'].values is old_values
+    assert np.all(old_values == 2.)
+    assert dict1['quantity'].attrs['units'] == 'm'
+
+
+def test_update_dict_by_adding_another_adds_data_arrays_with_misaligned_coords():
+    dict1 = {
+        'quantity': DataArray(
+            np.ones([3]), dims=['dim1'], coords={'dim1': [0, 1, 2]},
+            attrs={'units': 'm'})
+    }
+    dict2 = {
+        'quantity': DataArray(
+            np.ones([3]), dims=['dim1'], coords={'dim1': [1, 2, 3]},
+            attrs={'units': 'm'})
+    }
+    update_dict_by_adding_another(dict1, dict2)
+    assert list(dict1['quantity'].coords['dim1'].values) == [1, 2]
+    assert np.all(dict1['quantity'].values == 2.)
+
+
+def test_jit_without_parentheses():
+
+    @jit
+    def double(x):
+        return 2*x
+
+    assert double(2.) == 4.
+
+
+def test_jit_with_keyword_arguments():
+
+    @jit(nopython=True)
+    def double(x):
+        return 2*x
+
+    assert double(2.) == 4.
+
+
+def test_jit_with_signature():
+
+    @jit('float64(float64)')
+    def double(x):
+        return 2*x
+
+    assert double(2.) == 4.
+
+
 class DummyTendencyComponent(TendencyComponent):
     input_properties = {'temperature': {'alias': 'T'}}
     diagnostic_properties = {'pressure': {'alias': 'P'}}
@@ -508,6 +567,41 @@ def test_ensure_no_shared_keys_with_shared_keys():
             'No exception raised but expected SharedKeyError.')
 
 
+def test_flatten_wildcard_dims_middle():
+    array = np.random.randn(2, 3, 4, 5)
+    result = flatten_wildcard_dims(array, 1, 3)
+    assert result.shape == (2, 12, 5)
+    assert np.all(result == array.reshape((2, 12, 5)))
+
+
+def test_flatten_wildcard_dims_inserts_singleton():
+    array = np.random.randn(2, 3)
+    assert flatten_wildcard_dims(array, 1, 1).shape == (2, 1, 3)
+    assert flatten_wildcard_dims(array, 2, 2).shape == (2, 3, 1)
+
+
+def test_flatten_wildcard_dims_invalid_range():
+    array = np.random.randn(2, 3)
+    with pytest.raises(ValueError):
+        flatten_wildcard_dims(array, 2, 1)
+
+
+def test_fill_dims_wildcard_expands_wildcard():
+    dim_lengths = {'x': 2, 'y': 3, 'z': 4}
+    out_dims, target_shape = fill_dims_wildcard(
+        ['z', '*'], dim_lengths, ('x', 'y'))
+    assert out_dims == ['z', 'x', 'y']
+    assert target_shape == [4, 2, 3]
+
+
+def test_fill_dims_wildcard_without_expanding_wildcard():
+    dim_lengths = {'x': 2, 'y': 3, 'z': 4}
+    out_dims, target_shape = fill_dims_wildcard(
+        ['*', 'z'], dim_lengths, ('x', 'y'), expand_wildcard=False)
+    assert out_dims == ['z']
+    assert target_shape == [6, 4]
+
+
 class CombineDimsTests(unittest.TestCase):
 
     def test_same_dims(self):
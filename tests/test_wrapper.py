@@ -207,6 +207,32 @@ class UpdateFrequencyBase(object):
         result = self.call_component(component, {'time': timedelta(minutes=59)})
         assert component.times_called == 1
 
+    def test_set_update_frequency_accepts_timestep(self):
+        component = UpdateFrequencyWrapper(self.get_component(), timedelta(hours=1))
+        result = component({'time': timedelta(hours=0)}, timedelta(minutes=1))
+        result = component({'time': timedelta(hours=1)}, timedelta(minutes=1))
+        assert component.times_called == 2
+
+    def test_set_update_every_n_calls(self):
+        component = UpdateFrequencyWrapper(
+            self.get_component(), update_every_n_calls=3)
+        assert isinstance(component, self.component_type)
+        state = {'time': timedelta(hours=0)}
+        for i in range(7):
+            result = self.call_component(component, state)
+        assert component.times_called == 3
+
+    def test_set_update_frequency_requires_one_of_timedelta_or_calls(self):
+        with self.assertRaises(ValueError):
+            UpdateFrequencyWrapper(self.get_component())
+        with self.assertRaises(ValueError):
+            UpdateFrequencyWrapper(
+                self.get_component(), timedelta(hours=1),
+                update_every_n_calls=2)
+        with self.assertRaises(ValueError):
+            UpdateFrequencyWrapper(
+                self.get_component(), update_every_n_calls=0)
+
 
 class PrognosticUpdateFrequencyTests(unittest.TestCase, UpdateFrequencyBase):
 
@@ -263,6 +289,47 @@ def test_scaled_component_wrong_type():
         ScalingWrapper(wrong_component)
 
 
+def test_scaled_component_non_numeric_scale_factor():
+    component = MockTendencyComponent(
+        input_properties={},
+        diagnostic_properties={},
+        tendency_properties={'diag1': {'dims': ['dim1'], 'units': 'm'}},
+        diagnostic_output={},
+        tendency_output={},
+    )
+    with pytest.raises(ValueError):
+        ScalingWrapper(component, tendency_scale_factors={'diag1': 'ten'})
+
+
+def test_scaled_stepper_requires_timestep():
+    component = ScalingWrapper(MockEmptyImplicit())
+    with pytest.raises(TypeError):
+        component({'time': timedelta(0)})
+
+
+def test_scaled_implicit_prognostic_requires_timestep():
+    component = ScalingWrapper(MockEmptyImplicitPrognostic())
+    with pytest.raises(TypeError):
+        component({'time': timedelta(0)})
+
+
+def test_scaled_prognostic_ignores_timestep():
+    component = ScalingWrapper(MockEmptyPrognostic())
+    tendencies, diagnostics = component(
+        {'time': timedelta(0)}, timedelta(hours=1))
+    assert tendencies == {}
+    assert diagnostics == {}
+
+
+def test_wrappers_accept_new_attributes():
+    scaled = ScalingWrapper(MockEmptyPrognostic())
+    scaled.tag = 'scaled'
+    assert scaled.tag == 'scaled'
+    updated = UpdateFrequencyWrapper(MockEmptyPrognostic(), timedelta(hours=1))
+    updated.tag = 'updated'
+    assert updated.tag == 'updated'
+
+
 class ScalingInputMixin(object):
 
     def test_inputs_no_scaling(self):
@@ -396,6 +463,64 @@ class ScalingInputMixin(object):
         assert np.all(base_component.state_given['input1'] == 500.)
         assert np.all(base_component.state_given['input2'] == 1.)
 
+    def test_inputs_unscaled_are_not_copied(self):
+        self.input_properties = {
+            'input1': {
+                'dims': ['dim1'],
+                'units': 'm',
+            },
+            'input2': {
+                'dims': ['dim1'],
+                'units': 'm',
+            },
+        }
+        state = {
+            'time': timedelta(0),
+            'input1': DataArray(
+                np.ones([10]),
+                dims=['dim1'],
+                attrs={'units': 'm'}
+            ),
+            'input2': DataArray(
+                np.ones([10]),
+                dims=['dim1'],
+                attrs={'units': 'm'}
+            ),
+        }
+        for input_scale_factors in ({}, {'input1': 10.}):
+            base_component = self.get_component()
+            component = ScalingWrapper(
+                base_component, input_scale_factors=input_scale_factors)
+            self.call_component(component, state)
+            assert np.may_share_memory(
+                base_component.state_given['input2'], state['input2'].values)
+
+    def test_inputs_scaling_does_not_modify_state(self):
+        self.input_properties = {
+            'input1': {
+                'dims': ['dim1'],
+                'units': 'm',
+            },
+        }
+        state = {
+            'time': timedelta(0),
+            'input1': DataArray(
+                np.ones([10]),
+                dims=['dim1'],
+                attrs={'units': 'm'}
+            ),
+        }
+        base_component = self.get_component()
+        component = ScalingWrapper(
+            base_component,
+            input_scale_factors={
+                'input1': 10.
+            })
+        self.call_component(component, state)
+        assert np.all(base_component.state_given['input1'] == 10.)
+        assert np.all(state['input1'].values == 1.)
+        assert state['input1'].attrs == {'units': 'm'}
+
 
 class ScalingOutputMixin(object):
 
@@ -614,6 +739,56 @@ class ScalingTendencyMixin(object):
         assert tendencies.keys() == self.tendency_output.keys()
         assert np.all(tendencies['diag1'] == 10.)
 
+    def test_tendency_scaling_does_not_modify_component_output(self):
+        self.tendency_properties = {
+            'diag1': {
+                'dims': ['dim1'],
+                'units': 'm',
+            }
+        }
+        self.tendency_output = {
+            'diag1': np.ones([10])
+        }
+        base_component = self.get_component()
+        component = ScalingWrapper(
+            base_component,
+            tendency_scale_factors={
+                'diag1': 10.,
+            },
+        )
+        state = {'time': timedelta(0)}
+        self.call_component(component, state)
+        tendencies = self.get_tendencies(
+            self.call_component(component, state))
+        assert np.all(tendencies['diag1'] == 10.)
+        assert tendencies['diag1'].attrs['units'] == 'm'
+        assert np.all(self.tendency_output['diag1'] == 1.)
+
+    def test_tendency_scaling_applies_to_tendencies_in_diagnostics(self):
+        self.tendency_properties = {
+            'diag1': {
+                'dims': ['dim1'],
+                'units': 'm',
+            }
+        }
+        self.tendency_output = {
+            'diag1': np.ones([10])
+        }
+        base_component = self.get_component(
+            tendencies_in_diagnostics=True, name='component')
+        component = ScalingWrapper(
+            base_component,
+            tendency_scale_factors={
+                'diag1': 10.,
+            },
+        )
+        state = {'time': timedelta(0)}
+        output = self.call_component(component, state)
+        tendencies = self.get_tendencies(output)
+        diagnostics = self.get_diagnostics(output)
+        assert np.all(tendencies['diag1'] == 10.)
+        assert np.all(diagnostics['diag1_tendency_from_component'] == 10.)
+
     def test_tendency_no_scaling_when_input_scaled(self):
         self.input_properties = {
             'diag1': {
@@ -688,13 +863,14 @@ class PrognosticScalingTests(
         self.diagnostic_output = {}
         self.tendency_output = {}
 
-    def get_component(self):
+    def get_component(self, **kwargs):
         return MockTendencyComponent(
             self.input_properties,
             self.diagnostic_properties,
             self.tendency_properties,
             self.diagnostic_output,
             self.tendency_output,
+            **kwargs
         )
 
     def get_diagnostics(self, output):
@@ -720,13 +896,14 @@ class ImplicitPrognosticScalingTests(
         self.diagnostic_output = {}
         self.tendency_output = {}
 
-    def get_component(self):
+    def get_component(self, **kwargs):
         return MockImplicitTendencyComponent(
             self.input_properties,
             self.diagnostic_properties,
             self.tendency_properties,
             self.diagnostic_output,
             self.tendency_output,
+            **kwargs
         )
 
     def get_diagnostics(self, output):